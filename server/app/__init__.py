@@ -1,21 +1,37 @@
 import os
 from flask import Flask
 from .config import get_config
-from .extensions import db, migrate, cors
-from .api import create_api_blueprint
+from .extensions import db, init_cors
 from .cli import register_cli
 
-def create_app() -> Flask:
+
+def _base_app() -> Flask:
     app = Flask(__name__)
 
     env = os.getenv("FLASK_ENV", "development")
     app.config.from_object(get_config(env))
 
     db.init_app(app)
-    migrate.init_app(app, db)
-    cors.init_app(app, resources={r"/api/*": {"origins": app.config.get("CORS_ORIGINS")}})
+    register_cli(app)
+    return app
 
-    app.register_blueprint(create_api_blueprint(), url_prefix="/api")
 
-    register_cli(app)
+def create_app() -> Flask:
+    app = _base_app()
+
+    from .api import create_api_blueprint
+    from .coalesce import drag_flights
+    from .ratelimit import drag_limiter
+    from .sandbox import sandboxes
+
+    init_cors(app)
+    sandboxes.init_app(app)
+    drag_flights.init_app(app)
+    drag_limiter.init_app(app)
+    app.register_blueprint(create_api_blueprint(), url_prefix="/api")
     return app
+
+
+def create_cli_app() -> Flask:
+    """App without the HTTP API or CORS, for `flask seed`/`db` and batch jobs."""
+    return _base_app()
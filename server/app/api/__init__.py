@@ -1,9 +1,13 @@
 from flask import Blueprint
 from .work_orders import bp as work_orders_bp
 from .operations import bp as operations_bp
+from .sandboxes import bp as sandboxes_bp
+from .metrics import bp as metrics_bp
 
 def create_api_blueprint():
     api = Blueprint("api", __name__)
     api.register_blueprint(work_orders_bp, url_prefix="/work-orders")
     api.register_blueprint(operations_bp, url_prefix="/operations")
+    api.register_blueprint(sandboxes_bp, url_prefix="/sandboxes")
+    api.register_blueprint(metrics_bp, url_prefix="/metrics")
     return api
@@ -0,0 +1,16 @@
+from flask import Blueprint, jsonify
+from ..coalesce import drag_flights, schedule_version
+from ..ratelimit import drag_limiter
+
+bp = Blueprint("metrics", __name__)
+
+
+@bp.get("")
+def get_metrics():
+    return jsonify(
+        {
+            "scheduleVersion": schedule_version(),
+            "rateLimit": drag_limiter.stats(),
+            "coalescing": drag_flights.stats(),
+        }
+    )
@@ -2,7 +2,10 @@ from datetime import datetime
 from flask import Blueprint, jsonify, request
 from ..extensions import db
 from ..models import Operation
+from ..coalesce import drag_flights, schedule_version
+from ..ratelimit import drag_limiter
 from ..rules import validate_update, get_scheduling_constraints, find_valid_time_slot
+from .sandboxes import get_request_sandbox
 
 bp = Blueprint("operations", __name__)
 
@@ -13,12 +16,14 @@ def update_operation(op_id):
     start = datetime.fromisoformat(body["start"].replace("Z", "+00:00"))
     end = datetime.fromisoformat(body["end"].replace("Z", "+00:00"))
 
+    sandbox = get_request_sandbox()
     op = Operation.query.get_or_404(op_id)
 
-    original_start = op.start_utc
-    original_end = op.end_utc
+    current = sandbox.view(op) if sandbox else op
+    original_start = current.start_utc
+    original_end = current.end_utc
 
-    ok, err = validate_update(op, start, end)
+    ok, err = validate_update(op, start, end, sandbox)
 
     if not ok:
         return (
@@ -41,24 +46,30 @@ def update_operation(op_id):
             400,
         )
 
+    payload = {
+        "id": op.id,
+        "workOrderId": op.work_order_id,
+        "name": op.name,
+        "start": start.isoformat().replace("+00:00", "Z"),
+        "end": end.isoformat().replace("+00:00", "Z"),
+        "success": True,
+    }
+
+    if sandbox:
+        with sandbox.lock:
+            sandbox.stage(op, start, end)
+        payload["sandboxId"] = sandbox.id
+        return jsonify(payload)
+
     op.start_utc, op.end_utc = start, end
     db.session.commit()
 
-    return jsonify(
-        {
-            "id": op.id,
-            "workOrderId": op.work_order_id,
-            "name": op.name,
-            "start": op.start_utc.isoformat().replace("+00:00", "Z"),
-            "end": op.end_utc.isoformat().replace("+00:00", "Z"),
-            "success": True,
-        }
-    )
+    return jsonify(payload)
 
 
 @bp.get("/<op_id>/constraints")
 def get_operation_constraints(op_id):
-    constraints = get_scheduling_constraints(op_id)
+    constraints = get_scheduling_constraints(op_id, get_request_sandbox())
 
     if not constraints:
         return jsonify({"error": "Operation not found"}), 404
@@ -66,43 +77,93 @@ def get_operation_constraints(op_id):
     return jsonify(constraints)
 
 
+def _sandbox_key(sandbox):
+    return (sandbox.id, sandbox.version) if sandbox else None
+
+
+def _validate_move(op_id, start, end, sandbox):
+    op = Operation.query.get_or_404(op_id)
+    ok, err = validate_update(op, start, end, sandbox)
+
+    if ok:
+        return {"valid": True, "message": "Operation can be moved to this time slot"}, 200
+
+    suggested_start = None
+    if "conflictWith" in err:
+        duration_hours = (end - start).total_seconds() / 3600
+        suggested_start = find_valid_time_slot(
+            op.machine_id,
+            duration_hours,
+            start,
+            op.work_order_id,
+            op.idx,
+            op.id,
+            sandbox,
+        )
+
+    response = {"valid": False, "message": err["message"], "details": err}
+
+    if suggested_start:
+        suggested_end = datetime.fromtimestamp(
+            suggested_start.timestamp() + (end - start).total_seconds(),
+            tz=suggested_start.tzinfo,
+        )
+        response["suggestion"] = {
+            "start": suggested_start.isoformat().replace("+00:00", "Z"),
+            "end": suggested_end.isoformat().replace("+00:00", "Z"),
+        }
+
+    return response, 400
+
+
 @bp.post("/<op_id>/validate")
+@drag_limiter.limit("validate")
 def validate_operation_move(op_id):
     body = request.get_json(force=True)
     start = datetime.fromisoformat(body["start"].replace("Z", "+00:00"))
     end = datetime.fromisoformat(body["end"].replace("Z", "+00:00"))
 
+    sandbox = get_request_sandbox()
+    # Drag bursts repeat the same move; identical requests share one result.
+    key = ("validate", op_id, start, end, _sandbox_key(sandbox), schedule_version())
+    payload, status = drag_flights.do(
+        key, lambda: _validate_move(op_id, start, end, sandbox)
+    )
+    return jsonify(payload), status
+
+
+def _find_slot(op_id, preferred_start, duration_hours, sandbox):
     op = Operation.query.get_or_404(op_id)
-    ok, err = validate_update(op, start, end)
 
-    if ok:
-        return jsonify(
-            {"valid": True, "message": "Operation can be moved to this time slot"}
+    valid_start = find_valid_time_slot(
+        op.machine_id,
+        duration_hours,
+        preferred_start,
+        op.work_order_id,
+        op.idx,
+        op.id,
+        sandbox,
+    )
+
+    if valid_start:
+        valid_end = datetime.fromtimestamp(
+            valid_start.timestamp() + duration_hours * 3600, tz=valid_start.tzinfo
         )
-    else:
-        suggested_start = None
-        if "conflictWith" in err:
-            duration_hours = (end - start).total_seconds() / 3600
-            suggested_start = find_valid_time_slot(
-                op.machine_id, duration_hours, start, op.work_order_id, op.idx, op.id
-            )
-
-        response = {"valid": False, "message": err["message"], "details": err}
-
-        if suggested_start:
-            suggested_end = datetime.fromtimestamp(
-                suggested_start.timestamp() + (end - start).total_seconds(),
-                tz=suggested_start.tzinfo,
-            )
-            response["suggestion"] = {
-                "start": suggested_start.isoformat().replace("+00:00", "Z"),
-                "end": suggested_end.isoformat().replace("+00:00", "Z"),
+        return {
+            "validSlot": {
+                "start": valid_start.isoformat().replace("+00:00", "Z"),
+                "end": valid_end.isoformat().replace("+00:00", "Z"),
             }
+        }, 200
 
-        return jsonify(response), 400
+    return {
+        "validSlot": None,
+        "message": "No valid time slot found for the requested duration",
+    }, 404
 
 
 @bp.get("/<op_id>/valid-slots")
+@drag_limiter.limit("valid-slots")
 def get_valid_time_slots(op_id):
     start_param = request.args.get("start")
     duration_param = request.args.get("duration")
@@ -116,31 +177,16 @@ def get_valid_time_slots(op_id):
     except ValueError:
         return jsonify({"error": "Invalid start time or duration format"}), 400
 
-    op = Operation.query.get_or_404(op_id)
-
-    valid_start = find_valid_time_slot(
-        op.machine_id, duration_hours, preferred_start, op.work_order_id, op.idx, op.id
+    sandbox = get_request_sandbox()
+    key = (
+        "valid-slots",
+        op_id,
+        preferred_start,
+        duration_hours,
+        _sandbox_key(sandbox),
+        schedule_version(),
     )
-
-    if valid_start:
-        valid_end = datetime.fromtimestamp(
-            valid_start.timestamp() + duration_hours * 3600, tz=valid_start.tzinfo
-        )
-        return jsonify(
-            {
-                "validSlot": {
-                    "start": valid_start.isoformat().replace("+00:00", "Z"),
-                    "end": valid_end.isoformat().replace("+00:00", "Z"),
-                }
-            }
-        )
-    else:
-        return (
-            jsonify(
-                {
-                    "validSlot": None,
-                    "message": "No valid time slot found for the requested duration",
-                }
-            ),
-            404,
-        )
+    payload, status = drag_flights.do(
+        key, lambda: _find_slot(op_id, preferred_start, duration_hours, sandbox)
+    )
+    return jsonify(payload), status
@@ -0,0 +1,108 @@
+from flask import Blueprint, abort, jsonify, make_response, request
+from ..extensions import db
+from ..models import Operation
+from ..rules import validate_update
+from ..sandbox import sandboxes
+
+bp = Blueprint("sandboxes", __name__)
+
+
+def get_request_sandbox():
+    """Sandbox named by the `sandbox` query parameter, or None for committed state."""
+    sandbox_id = request.args.get("sandbox")
+    if not sandbox_id:
+        return None
+
+    sandbox = sandboxes.get(sandbox_id)
+    if not sandbox:
+        abort(make_response(jsonify({"error": "Sandbox not found"}), 404))
+    return sandbox
+
+
+@bp.post("")
+def create_sandbox():
+    sandbox = sandboxes.create()
+    return jsonify(sandbox.to_dict()), 201
+
+
+@bp.get("/<sandbox_id>")
+def get_sandbox(sandbox_id):
+    sandbox = sandboxes.get(sandbox_id)
+    if not sandbox:
+        return jsonify({"error": "Sandbox not found"}), 404
+
+    with sandbox.lock:
+        return jsonify(sandbox.to_dict())
+
+
+@bp.delete("/<sandbox_id>")
+def discard_sandbox(sandbox_id):
+    sandbox = sandboxes.discard(sandbox_id)
+    if not sandbox:
+        return jsonify({"error": "Sandbox not found"}), 404
+
+    return jsonify({"id": sandbox.id, "discarded": True})
+
+
+@bp.post("/<sandbox_id>/commit")
+def commit_sandbox(sandbox_id):
+    sandbox = sandboxes.get(sandbox_id)
+    if not sandbox:
+        return jsonify({"error": "Sandbox not found"}), 404
+
+    with sandbox.lock:
+        ops = (
+            Operation.query.filter(Operation.id.in_(list(sandbox.moves)))
+            .with_for_update()
+            .all()
+        )
+
+        # Someone changed the committed schedule under a staged move.
+        stale = sorted(
+            set(sandbox.moves)
+            - {op.id for op in ops if (op.start_utc, op.end_utc) == sandbox.base[op.id]}
+        )
+        if stale:
+            db.session.rollback()
+            return (
+                jsonify(
+                    {
+                        "code": "SANDBOX_STALE",
+                        "message": "Operations changed since they were staged",
+                        "operations": stale,
+                    }
+                ),
+                409,
+            )
+
+        # Every move is checked against the final state: committed rows plus
+        # all staged moves.
+        for op in ops:
+            start, end = sandbox.moves[op.id]
+            ok, err = validate_update(op, start, end, sandbox)
+            if not ok:
+                db.session.rollback()
+                return (
+                    jsonify(
+                        {
+                            "code": "RULE_VIOLATION",
+                            "message": err["message"],
+                            "details": err,
+                            "operation": {
+                                "id": op.id,
+                                "workOrderId": op.work_order_id,
+                                "name": op.name,
+                            },
+                        }
+                    ),
+                    400,
+                )
+
+        for op in ops:
+            op.start_utc, op.end_utc = sandbox.moves[op.id]
+        db.session.commit()
+        sandboxes.discard(sandbox.id)
+
+    return jsonify(
+        {"id": sandbox.id, "committed": sorted(sandbox.moves), "success": True}
+    )
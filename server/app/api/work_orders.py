@@ -1,11 +1,16 @@
 from flask import Blueprint, jsonify
 from ..models import WorkOrder
+from .sandboxes import get_request_sandbox
 
 bp = Blueprint("work_orders", __name__)
 
 @bp.get("")
 def list_work_orders():
+    sandbox = get_request_sandbox()
+
     def op_to_dict(op):
+        if sandbox:
+            op = sandbox.view(op)
         start = op.start_utc.isoformat().replace("+00:00", "Z")
         end = op.end_utc.isoformat().replace("+00:00", "Z")
         return {
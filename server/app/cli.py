@@ -1,10 +1,34 @@
 import os
 import json
 from datetime import datetime
-from .extensions import db
+from flask import current_app
+from flask.cli import AppGroup
+from .extensions import db, init_migrate
 from .models import WorkOrder, Operation
 
+
+class LazyMigrateGroup(AppGroup):
+    """Stand-in for the `flask db` group.
+
+    Flask-Migrate (and Alembic behind it) is only imported and attached to the
+    app once a `db` subcommand is actually looked up, so `flask seed`, workers
+    and the API server don't pay for it on every start.
+    """
+
+    def _load(self):
+        app = current_app._get_current_object()
+        if "migrate" not in app.extensions:
+            init_migrate(app)
+        from flask_migrate.cli import db as db_cli_group
+        return db_cli_group
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self._load().make_context(info_name, args, parent=parent, **extra)
+
+
 def register_cli(app):
+    app.cli.add_command(LazyMigrateGroup("db", help="Perform database migrations."))
+
     @app.cli.command("seed")
     def seed():
         """Load sample data from server/seeds/seed.json."""
@@ -0,0 +1,128 @@
+import threading
+import time
+from sqlalchemy import event
+from .extensions import db
+from .models import Operation
+
+_version_lock = threading.Lock()
+_schedule_version = 0
+
+
+def schedule_version():
+    """Counter bumped whenever this process commits a change to operations."""
+    return _schedule_version
+
+
+def bump_schedule_version():
+    global _schedule_version
+    with _version_lock:
+        _schedule_version += 1
+
+
+def _track_operation_changes(session, flush_context, instances):
+    if any(
+        isinstance(obj, Operation)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info["schedule_changed"] = True
+
+
+def _bump_after_commit(session):
+    if session.info.pop("schedule_changed", False):
+        bump_schedule_version()
+
+
+def _forget_after_rollback(session):
+    session.info.pop("schedule_changed", None)
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Share one computation between identical concurrent requests.
+
+    The first caller for a key runs the function; callers that arrive while it
+    is running wait for its result instead of recomputing. Results are then
+    memoized for a short TTL. Keys must include everything the result depends
+    on (callers add the schedule version so commits invalidate old entries).
+    Errors are passed to the waiting callers but never memoized.
+    """
+
+    def __init__(self, ttl_seconds=2.0, max_entries=4096):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._memo = {}  # key -> (expires_at, result)
+        self._counters = {"computed": 0, "coalesced": 0, "memoHits": 0}
+
+    def init_app(self, app):
+        self.ttl_seconds = app.config.get("DRAG_MEMO_TTL_SECONDS", self.ttl_seconds)
+        app.extensions["single_flight"] = self
+
+        if not event.contains(db.session, "before_flush", _track_operation_changes):
+            event.listen(db.session, "before_flush", _track_operation_changes)
+            event.listen(db.session, "after_commit", _bump_after_commit)
+            event.listen(db.session, "after_rollback", _forget_after_rollback)
+
+    def _remember(self, key, result, now):
+        if len(self._memo) >= self.max_entries:
+            for k in [k for k, (expires_at, _) in self._memo.items() if expires_at <= now]:
+                del self._memo[k]
+            while len(self._memo) >= self.max_entries:
+                del self._memo[next(iter(self._memo))]
+        self._memo[key] = (now + self.ttl_seconds, result)
+
+    def do(self, key, fn):
+        now = time.monotonic()
+        with self._lock:
+            memoized = self._memo.get(key)
+            if memoized and memoized[0] > now:
+                self._counters["memoHits"] += 1
+                return memoized[1]
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self._counters["computed"] += 1
+            else:
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if call.error is None and self.ttl_seconds > 0:
+                    self._remember(key, call.result, time.monotonic())
+            call.event.set()
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._counters,
+                "inflight": len(self._inflight),
+                "memoEntries": len(self._memo),
+                "memoTtlSeconds": self.ttl_seconds,
+            }
+
+
+drag_flights = SingleFlight()
@@ -11,6 +11,10 @@ class BaseConfig:
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
     JSON_SORT_KEYS = False
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
+    SANDBOX_TTL_SECONDS = int(os.getenv("SANDBOX_TTL_SECONDS", "3600"))
+    DRAG_MEMO_TTL_SECONDS = float(os.getenv("DRAG_MEMO_TTL_SECONDS", "2"))
+    DRAG_RATE_LIMIT_PER_SECOND = float(os.getenv("DRAG_RATE_LIMIT_PER_SECOND", "20"))
+    DRAG_RATE_LIMIT_BURST = int(os.getenv("DRAG_RATE_LIMIT_BURST", "40"))
 
 class DevelopmentConfig(BaseConfig):
     DEBUG = True
@@ -1,7 +1,21 @@
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from flask_cors import CORS
 
 db = SQLAlchemy()
-migrate = Migrate()
-cors = CORS()
+
+
+def init_migrate(app):
+    """Attach Flask-Migrate. Imported on demand because it pulls in Alembic."""
+    from flask_migrate import Migrate
+
+    migrate = Migrate()
+    migrate.init_app(app, db)
+    return migrate
+
+
+def init_cors(app):
+    """Attach Flask-CORS for the API routes. Only the HTTP app needs it."""
+    from flask_cors import CORS
+
+    cors = CORS()
+    cors.init_app(app, resources={r"/api/*": {"origins": app.config.get("CORS_ORIGINS")}})
+    return cors
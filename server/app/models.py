@@ -1,5 +1,30 @@
+from datetime import timezone
+from sqlalchemy.types import DateTime, TypeDecorator
 from .extensions import db
 
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware DateTime that always loads as UTC.
+
+    SQLite drops tzinfo, so values are normalised to UTC before they are
+    stored and naive values are tagged as UTC on load. The rules compare
+    against aware datetimes.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class WorkOrder(db.Model):
     __tablename__ = "work_orders"
     id = db.Column(db.String, primary_key=True)
@@ -19,8 +44,8 @@ class Operation(db.Model):
     idx = db.Column(db.Integer, nullable=False)
     machine_id = db.Column(db.String, nullable=False)
     name = db.Column(db.String, nullable=False)
-    start_utc = db.Column(db.DateTime(timezone=True), nullable=False)
-    end_utc = db.Column(db.DateTime(timezone=True), nullable=False)
+    start_utc = db.Column(UTCDateTime, nullable=False)
+    end_utc = db.Column(UTCDateTime, nullable=False)
 
     __table_args__ = (
         db.UniqueConstraint("work_order_id", "idx", name="ux_ops_wo_idx"),
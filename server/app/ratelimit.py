@@ -0,0 +1,98 @@
+import math
+import threading
+import time
+from functools import wraps
+from flask import jsonify, request
+
+
+class TokenBucketLimiter:
+    """Per-client token buckets, one per (client address, scope).
+
+    Each bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second; a request spends one token or gets a 429. A rate of 0 disables
+    limiting. Buckets idle for `idle_seconds` are dropped.
+    """
+
+    def __init__(self, rate=20.0, burst=40, idle_seconds=300):
+        self.rate = rate
+        self.burst = burst
+        self.idle_seconds = idle_seconds
+        self._lock = threading.Lock()
+        self._buckets = {}  # (client, scope) -> [tokens, updated_at]
+        self._counters = {}  # scope -> {"allowed": n, "limited": n}
+        self._last_sweep = time.monotonic()
+
+    def init_app(self, app):
+        self.rate = app.config.get("DRAG_RATE_LIMIT_PER_SECOND", self.rate)
+        self.burst = app.config.get("DRAG_RATE_LIMIT_BURST", self.burst)
+        app.extensions["rate_limiter"] = self
+
+    def _sweep(self, now):
+        idle = [k for k, (_, updated_at) in self._buckets.items()
+                if now - updated_at > self.idle_seconds]
+        for k in idle:
+            del self._buckets[k]
+        self._last_sweep = now
+
+    def acquire(self, client, scope):
+        """Spend a token. Returns (allowed, seconds until the next token)."""
+        now = time.monotonic()
+        with self._lock:
+            counters = self._counters.setdefault(scope, {"allowed": 0, "limited": 0})
+            if self.rate <= 0:
+                counters["allowed"] += 1
+                return True, 0.0
+
+            if now - self._last_sweep > self.idle_seconds:
+                self._sweep(now)
+
+            bucket = self._buckets.get((client, scope))
+            if bucket is None:
+                bucket = self._buckets[(client, scope)] = [float(self.burst), now]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                counters["allowed"] += 1
+                return True, 0.0
+
+            counters["limited"] += 1
+            return False, (1 - bucket[0]) / self.rate
+
+    def limit(self, scope):
+        """Decorator applying the limit to a view, keyed by the client address."""
+
+        def decorator(view):
+            @wraps(view)
+            def wrapped(*args, **kwargs):
+                allowed, retry_after = self.acquire(request.remote_addr, scope)
+                if not allowed:
+                    response = jsonify(
+                        {
+                            "code": "RATE_LIMITED",
+                            "message": "Too many requests, slow down",
+                            "retryAfter": retry_after,
+                        }
+                    )
+                    response.status_code = 429
+                    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+                    return response
+                return view(*args, **kwargs)
+
+            return wrapped
+
+        return decorator
+
+    def stats(self):
+        with self._lock:
+            return {
+                "ratePerSecond": self.rate,
+                "burst": self.burst,
+                "clients": len({client for client, _ in self._buckets}),
+                "scopes": {scope: dict(c) for scope, c in self._counters.items()},
+            }
+
+
+drag_limiter = TokenBucketLimiter()
@@ -6,7 +6,37 @@ def overlaps(a_start, a_end, b_start, b_end):
     return max(a_start, b_start) < min(a_end, b_end)
 
 
-def validate_update(op: Operation, new_start, new_end):
+# Every rule reads the schedule through these helpers. When an overlay (a
+# sandbox, see app/sandbox.py) is passed, its pending moves replace the
+# committed start/end of the operations they touch; everything else falls
+# through to the database.
+
+
+def _view(op, overlay):
+    return overlay.view(op) if overlay is not None else op
+
+
+def _get_operation(operation_id, overlay=None):
+    return _view(Operation.query.get(operation_id), overlay)
+
+
+def _sequence_neighbor(work_order_id, idx, overlay=None):
+    op = Operation.query.filter_by(work_order_id=work_order_id, idx=idx).first()
+    return _view(op, overlay)
+
+
+def _machine_operations(machine_id, exclude_op_id=None, overlay=None):
+    query = Operation.query.filter(Operation.machine_id == machine_id)
+    if exclude_op_id:
+        query = query.filter(Operation.id != exclude_op_id)
+
+    ops = query.order_by(Operation.start_utc).all()
+    if overlay is None:
+        return ops
+    return sorted((overlay.view(op) for op in ops), key=lambda op: op.start_utc)
+
+
+def validate_update(op: Operation, new_start, new_end, overlay=None):
     if new_start >= new_end:
         return False, {"message": "Start must be before end"}
 
@@ -18,9 +48,7 @@ def validate_update(op: Operation, new_start, new_end):
     if not work_order:
         return False, {"message": "Work order not found"}
 
-    prev = Operation.query.filter_by(
-        work_order_id=op.work_order_id, idx=op.idx - 1
-    ).first()
+    prev = _sequence_neighbor(op.work_order_id, op.idx - 1, overlay)
     if prev and new_start < prev.end_utc:
         return False, {
             "message": f"Operation must start after previous (idx {op.idx - 1} ends)",
@@ -28,9 +56,7 @@ def validate_update(op: Operation, new_start, new_end):
             "prevName": prev.name,
         }
 
-    next_op = Operation.query.filter_by(
-        work_order_id=op.work_order_id, idx=op.idx + 1
-    ).first()
+    next_op = _sequence_neighbor(op.work_order_id, op.idx + 1, overlay)
     if next_op and new_end > next_op.start_utc:
         return False, {
             "message": f"Operation must end before next (idx {op.idx + 1} starts)",
@@ -38,9 +64,7 @@ def validate_update(op: Operation, new_start, new_end):
             "nextName": next_op.name,
         }
 
-    siblings = Operation.query.filter(
-        Operation.machine_id == op.machine_id, Operation.id != op.id
-    ).all()
+    siblings = _machine_operations(op.machine_id, op.id, overlay)
     for s in siblings:
         if overlaps(new_start, new_end, s.start_utc, s.end_utc):
             return False, {
@@ -54,12 +78,14 @@ def validate_update(op: Operation, new_start, new_end):
     return True, None
 
 
-def validate_operation_sequence(work_order_id):
+def validate_operation_sequence(work_order_id, overlay=None):
     operations = (
         Operation.query.filter_by(work_order_id=work_order_id)
         .order_by(Operation.idx)
         .all()
     )
+    if overlay is not None:
+        operations = [overlay.view(op) for op in operations]
     violations = []
 
     for i in range(len(operations) - 1):
@@ -78,12 +104,10 @@ def validate_operation_sequence(work_order_id):
     return len(violations) == 0, violations
 
 
-def validate_machine_availability(machine_id, start_time, end_time, exclude_op_id=None):
-    query = Operation.query.filter(Operation.machine_id == machine_id)
-    if exclude_op_id:
-        query = query.filter(Operation.id != exclude_op_id)
-
-    conflicting_ops = query.all()
+def validate_machine_availability(
+    machine_id, start_time, end_time, exclude_op_id=None, overlay=None
+):
+    conflicting_ops = _machine_operations(machine_id, exclude_op_id, overlay)
     conflicts = []
 
     for op in conflicting_ops:
@@ -108,21 +132,18 @@ def find_valid_time_slot(
     work_order_id,
     operation_idx,
     exclude_op_id=None,
+    overlay=None,
 ):
     now = datetime.now(timezone.utc)
     duration_seconds = duration_hours * 3600
 
     earliest_start = max(now, preferred_start)
 
-    prev_op = Operation.query.filter_by(
-        work_order_id=work_order_id, idx=operation_idx - 1
-    ).first()
+    prev_op = _sequence_neighbor(work_order_id, operation_idx - 1, overlay)
     if prev_op:
         earliest_start = max(earliest_start, prev_op.end_utc)
 
-    next_op = Operation.query.filter_by(
-        work_order_id=work_order_id, idx=operation_idx + 1
-    ).first()
+    next_op = _sequence_neighbor(work_order_id, operation_idx + 1, overlay)
     latest_end = None
     if next_op:
         latest_end = next_op.start_utc
@@ -132,11 +153,7 @@ def find_valid_time_slot(
         if earliest_start > latest_start:
             return None
 
-    query = Operation.query.filter(Operation.machine_id == machine_id)
-    if exclude_op_id:
-        query = query.filter(Operation.id != exclude_op_id)
-
-    machine_ops = query.order_by(Operation.start_utc).all()
+    machine_ops = _machine_operations(machine_id, exclude_op_id, overlay)
 
     search_start = earliest_start
 
@@ -164,8 +181,8 @@ def find_valid_time_slot(
     return search_start
 
 
-def get_scheduling_constraints(operation_id):
-    op = Operation.query.get(operation_id)
+def get_scheduling_constraints(operation_id, overlay=None):
+    op = _get_operation(operation_id, overlay)
     if not op:
         return None
 
@@ -177,9 +194,7 @@ def get_scheduling_constraints(operation_id):
         "minStart": datetime.now(timezone.utc).isoformat(),
     }
 
-    prev_op = Operation.query.filter_by(
-        work_order_id=op.work_order_id, idx=op.idx - 1
-    ).first()
+    prev_op = _sequence_neighbor(op.work_order_id, op.idx - 1, overlay)
     if prev_op:
         constraints["minStart"] = prev_op.end_utc.isoformat()
         constraints["prevOperation"] = {
@@ -188,9 +203,7 @@ def get_scheduling_constraints(operation_id):
             "end": prev_op.end_utc.isoformat(),
         }
 
-    next_op = Operation.query.filter_by(
-        work_order_id=op.work_order_id, idx=op.idx + 1
-    ).first()
+    next_op = _sequence_neighbor(op.work_order_id, op.idx + 1, overlay)
     if next_op:
         constraints["maxEnd"] = next_op.start_utc.isoformat()
         constraints["nextOperation"] = {
@@ -199,9 +212,7 @@ def get_scheduling_constraints(operation_id):
             "start": next_op.start_utc.isoformat(),
         }
 
-    machine_conflicts = Operation.query.filter(
-        Operation.machine_id == op.machine_id, Operation.id != op.id
-    ).all()
+    machine_conflicts = _machine_operations(op.machine_id, op.id, overlay)
 
     constraints["machineConflicts"] = [
         {
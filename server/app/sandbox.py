@@ -0,0 +1,110 @@
+import threading
+import time
+import uuid
+
+
+class OverlayOperation:
+    """Read-only stand-in for an Operation with sandbox times applied."""
+
+    __slots__ = ("id", "work_order_id", "idx", "machine_id", "name", "start_utc", "end_utc")
+
+    def __init__(self, op, start, end):
+        self.id = op.id
+        self.work_order_id = op.work_order_id
+        self.idx = op.idx
+        self.machine_id = op.machine_id
+        self.name = op.name
+        self.start_utc = start
+        self.end_utc = end
+
+
+class Sandbox:
+    """Pending moves layered over the committed schedule.
+
+    Only the moves are stored (copy-on-write): creating a sandbox is O(1) and
+    reads of operations it hasn't touched fall through to the database.
+    """
+
+    def __init__(self, sandbox_id):
+        self.id = sandbox_id
+        self.created_at = time.time()
+        self.touched_at = self.created_at
+        self.version = 0  # bumped on every staged move
+        self.moves = {}  # op_id -> (start, end)
+        self.base = {}  # op_id -> committed (start, end) when first staged
+        self.lock = threading.Lock()
+
+    def view(self, op):
+        if op is None or op.id not in self.moves:
+            return op
+        start, end = self.moves[op.id]
+        return OverlayOperation(op, start, end)
+
+    def stage(self, op, start, end):
+        if op.id not in self.base:
+            self.base[op.id] = (op.start_utc, op.end_utc)
+        self.moves[op.id] = (start, end)
+        self.version += 1
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "moves": [
+                {
+                    "operationId": op_id,
+                    "start": start.isoformat().replace("+00:00", "Z"),
+                    "end": end.isoformat().replace("+00:00", "Z"),
+                    "originalStart": self.base[op_id][0].isoformat().replace("+00:00", "Z"),
+                    "originalEnd": self.base[op_id][1].isoformat().replace("+00:00", "Z"),
+                }
+                for op_id, (start, end) in self.moves.items()
+            ],
+        }
+
+
+class SandboxStore:
+    """In-process registry of sandboxes; idle ones expire after SANDBOX_TTL_SECONDS.
+
+    Sandboxes live in worker memory, so they are only visible to the process
+    that created them.
+    """
+
+    def __init__(self, ttl_seconds=3600):
+        self.ttl_seconds = ttl_seconds
+        self._sandboxes = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl_seconds = app.config.get("SANDBOX_TTL_SECONDS", self.ttl_seconds)
+        app.extensions["sandboxes"] = self
+
+    def _expire(self, now):
+        expired = [
+            sid for sid, sb in self._sandboxes.items()
+            if now - sb.touched_at > self.ttl_seconds
+        ]
+        for sid in expired:
+            del self._sandboxes[sid]
+
+    def create(self):
+        sandbox = Sandbox(uuid.uuid4().hex)
+        with self._lock:
+            self._expire(sandbox.created_at)
+            self._sandboxes[sandbox.id] = sandbox
+        return sandbox
+
+    def get(self, sandbox_id):
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            sandbox = self._sandboxes.get(sandbox_id)
+            if sandbox:
+                sandbox.touched_at = now
+            return sandbox
+
+    def discard(self, sandbox_id):
+        with self._lock:
+            return self._sandboxes.pop(sandbox_id, None)
+
+
+sandboxes = SandboxStore()
@@ -0,0 +1,102 @@
+"""Cold-start benchmark for the app factories.
+
+Each sample runs the factory in a fresh interpreter, so the numbers include
+every import a worker or `flask` CLI invocation pays for. One extra run with
+``-X importtime`` lists the slowest imports.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --top 25 --factory create_cli_app
+
+Exits non-zero when a factory's median start time is over its budget, so it
+can gate CI. Budgets come from STARTUP_BUDGET_MS (API app) and
+STARTUP_CLI_BUDGET_MS (CLI/batch app) or the --budget-ms flag.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUDGETS_MS = {
+    "create_app": float(os.getenv("STARTUP_BUDGET_MS", "800")),
+    "create_cli_app": float(os.getenv("STARTUP_CLI_BUDGET_MS", "700")),
+}
+
+
+def _snippet(factory):
+    return f"from app import {factory}; {factory}()"
+
+
+def _env():
+    env = dict(os.environ)
+    # The factories need a database URI to build the engine; nothing connects.
+    env.setdefault("DATABASE_URL", "sqlite://")
+    return env
+
+
+def time_cold_start(factory, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", _snippet(factory)],
+            cwd=SERVER_DIR,
+            env=_env(),
+            check=True,
+        )
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def import_report(factory, top):
+    """Return the `top` slowest imports as (cumulative_ms, self_ms, module)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _snippet(factory)],
+        cwd=SERVER_DIR,
+        env=_env(),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, module.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--factory", choices=sorted(BUDGETS_MS), action="append")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    over_budget = False
+    for factory in args.factory or sorted(BUDGETS_MS):
+        budget = args.budget_ms if args.budget_ms is not None else BUDGETS_MS[factory]
+        samples = time_cold_start(factory, args.runs)
+        median = statistics.median(samples)
+        status = "ok" if median <= budget else "OVER BUDGET"
+        print(f"{factory}: median {median:.0f} ms, min {min(samples):.0f} ms, "
+              f"max {max(samples):.0f} ms over {args.runs} runs "
+              f"(budget {budget:.0f} ms) {status}")
+
+        print(f"  {'cumulative':>10}  {'self':>8}  module")
+        for cumulative_ms, self_ms, module in import_report(factory, args.top):
+            print(f"  {cumulative_ms:8.1f}ms  {self_ms:6.1f}ms  {module}")
+        print()
+        over_budget = over_budget or median > budget
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())